@@ -1,26 +1,69 @@
 import streamlit as st
-import yfinance as yf
+import requests_cache
+
+# One shared keep-alive session for every Yahoo request, so the TLS
+# handshake is paid once instead of per ticker. It also caches responses
+# at the HTTP layer: repeated lookups within the hour are disk reads
+# instead of network round-trips.
+_SESSION = requests_cache.CachedSession(
+    '.yf_cache',
+    backend='sqlite',
+    expire_after=3600,
+    allowable_methods=('GET', 'POST')
+)
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+
 import pandas as pd
-import plotly.graph_objects as go
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # File to store tracked stocks
-STOCKS_FILE = 'tracked_stocks.txt'
+STOCKS_FILE = 'tracked_stocks.json'
+LEGACY_STOCKS_FILE = 'tracked_stocks.txt'
+
+# Refetch a stored market cap once it is older than a day
+MARKET_CAP_MAX_AGE = 86400
+
+def _as_stock_entry(value):
+    # Older files stored just the name; wrap it in the current schema
+    if isinstance(value, dict):
+        return value
+    return {'name': value, 'market_cap': None, 'mc_fetched_at': 0}
 
 def load_tracked_stocks():
     if os.path.exists(STOCKS_FILE):
         with open(STOCKS_FILE, 'r') as file:
-            return {line.strip().split(',')[0]: line.strip().split(',')[1] for line in file}
+            stocks = json.load(file)
+        return {symbol: _as_stock_entry(value) for symbol, value in stocks.items()}
+    # Migrate from the old comma-separated format on first run
+    if os.path.exists(LEGACY_STOCKS_FILE):
+        with open(LEGACY_STOCKS_FILE, 'r') as file:
+            names = dict(line.strip().split(',', 1) for line in file if line.strip())
+        stocks = {symbol: _as_stock_entry(name) for symbol, name in names.items()}
+        save_tracked_stocks(stocks)
+        return stocks
     return {}
 
 def save_tracked_stocks(stocks):
     with open(STOCKS_FILE, 'w') as file:
-        for symbol, name in stocks.items():
-            file.write(f"{symbol},{name}\n")
+        json.dump(stocks, file, indent=2)
+
+@st.cache_resource(show_spinner=False)
+def _load_tracked_stocks_cached(mtime):
+    # Keyed on the file's mtime, so one parsed dict serves every session
+    # and a save invalidates the cache on the next load
+    return load_tracked_stocks()
+
+def get_tracked_stocks():
+    mtime = os.path.getmtime(STOCKS_FILE) if os.path.exists(STOCKS_FILE) else 0
+    return _load_tracked_stocks_cached(mtime)
 
 # Initialize the session state to keep track of the stocks
 if 'tech_stocks' not in st.session_state:
-    st.session_state.tech_stocks = load_tracked_stocks()
+    st.session_state.tech_stocks = get_tracked_stocks()
 
 if 'remove_symbol' not in st.session_state:
     st.session_state.remove_symbol = None
@@ -28,48 +71,114 @@ if 'remove_symbol' not in st.session_state:
 if 'show_confirmation' not in st.session_state:
     st.session_state.show_confirmation = False
 
+# yf.download shares module-level state across threads, so serialize calls
+# in case concurrent Streamlit reruns overlap
+_download_lock = threading.Lock()
+
+@st.cache_data(ttl=300, show_spinner=False)
 def get_timeframe_data(symbols, period=None, start_date=None, end_date=None, interval='1d'):
-    stock_data = {}
-    for symbol in symbols:
-        stock = yf.Ticker(symbol)
-        if period:
-            hist = stock.history(period=period, interval=interval)
-        else:
-            hist = stock.history(start=start_date, end=end_date, interval=interval)
-        stock_data[symbol] = hist['Close']
-    return pd.DataFrame(stock_data)
+    # Nothing tracked yet (e.g. every stock removed) -- render an empty page
+    # instead of asking Yahoo for an empty ticker list
+    if not symbols:
+        return pd.DataFrame()
+
+    # Deferred so the first page paint doesn't block on the yfinance import
+    import yfinance as yf
+
+    # One batched download for all symbols instead of one request per symbol.
+    # group_by='column' puts the price field on the outer column level, so
+    # data['Close'] is already the (time, ticker) frame we want -- no
+    # per-symbol Series extraction or concat needed.
+    with _download_lock:
+        data = yf.download(
+            tickers=" ".join(symbols),
+            period=period,
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by='column',
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+            session=_SESSION
+        )
+    closes = data['Close']
+    if isinstance(closes, pd.Series):
+        # Single-ticker downloads come back with flat columns
+        closes = closes.to_frame(symbols[0])
+    # float32 is plenty for display math and halves the payload shipped to
+    # the Plotly front-end
+    return closes.astype('float32')
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_market_caps(symbols):
+    import yfinance as yf
+
+    # Market caps move slowly, so cache them for an hour across reruns.
+    # fast_info hits the lightweight quote endpoint instead of the full
+    # profile scrape, and the thread pool overlaps the per-ticker requests.
+    def fetch(symbol):
+        try:
+            # FastInfo.get() only matches the camelCase public keys;
+            # snake_case works through __getitem__ alone
+            return symbol, yf.Ticker(symbol, session=_SESSION).fast_info.get('marketCap', 0) or 0
+        except Exception:
+            # None marks a failed fetch so callers can keep their stored
+            # value and retry, instead of persisting a bogus zero
+            return symbol, None
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        return dict(executor.map(fetch, symbols))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_prices_and_changes(symbols, period=None, start_date=None, end_date=None, interval='1d'):
+    # Cached data layer: fetch once and precompute both change dicts so
+    # UI-only reruns (Y-axis, selection mode) just replot cached data
+    df = get_timeframe_data(symbols, period=period, start_date=start_date, end_date=end_date, interval=interval)
+    dollar_changes = calculate_changes(df, 'Dollar Value')
+    pct_changes = calculate_changes(df, 'Percentage Change')
+    return df, dollar_changes, pct_changes
 
 def calculate_changes(df, y_axis):
-    changes = {}
-    for column in df.columns:
-        start_price = df[column].iloc[0]
-        end_price = df[column].iloc[-1]
-        if y_axis == 'Dollar Value':
-            change = end_price - start_price
-        else:
-            change = ((end_price - start_price) / start_price) * 100
-        changes[column] = change
-    return changes
+    # Returns a Series so callers can rank with nlargest/nsmallest in C
+    if df.empty:
+        return pd.Series(dtype=float)
+    first = df.iloc[0]
+    last = df.iloc[-1]
+    diff = last - first
+    return diff if y_axis == 'Dollar Value' else diff / first * 100
 
 def plot_time_series(df, selected_stocks, y_axis, title):
-    fig = go.Figure()
-    percent_changes = {}
-
-    for stock in selected_stocks:
-        if y_axis == 'Dollar Value':
-            fig.add_trace(go.Scatter(x=df.index, y=df[stock], mode='lines', name=stock))
-            start_price = df[stock].iloc[0]
-            end_price = df[stock].iloc[-1]
-            percent_change = ((end_price - start_price) / start_price) * 100
-            percent_changes[stock] = percent_change
-        else:
-            start_price = df[stock].iloc[0]
-            percent_change = ((df[stock] - start_price) / start_price) * 100
-            fig.add_trace(go.Scatter(x=df.index, y=percent_change, mode='lines', name=stock))
-            end_price = df[stock].iloc[-1]
-            percent_changes[stock] = ((end_price - start_price) / start_price) * 100
+    # Nothing to plot (empty watchlist or no selection); df.iloc[0] below
+    # would raise on an empty frame
+    if df.empty or not selected_stocks:
+        return
+
+    # Deferred so the first page paint doesn't block on the plotly import
+    import plotly.graph_objects as go
 
-    fig.update_layout(
+    # Compute the percent-change series for all stocks in one broadcast
+    # instead of per-stock Series arithmetic inside the loop
+    starts = df.iloc[0]
+    pct_df = df.sub(starts).div(starts).mul(100)
+    final_pct = pct_df.iloc[-1]
+    final_price = df.iloc[-1]
+
+    # Build each trace with its final legend label so Plotly validates it
+    # only once, instead of adding traces and renaming them in a second pass
+    traces = [
+        go.Scatter(
+            x=df.index,
+            y=df[stock] if y_axis == 'Dollar Value' else pct_df[stock],
+            mode='lines',
+            name=(
+                f"{stock} ({final_pct[stock]:.2f}%)"
+                if y_axis == 'Dollar Value'
+                else f"{stock} (${final_price[stock]:.2f})"
+            )
+        )
+        for stock in selected_stocks
+    ]
+    layout = go.Layout(
         title=title,
         xaxis_title='Time',
         yaxis_title='Price ($)' if y_axis == 'Dollar Value' else 'Change (%)',
@@ -77,19 +186,11 @@ def plot_time_series(df, selected_stocks, y_axis, title):
         legend=dict(
             itemsizing='constant',
             itemclick='toggleothers'
-        )
+        ),
+        showlegend=True
     )
+    fig = go.Figure(data=traces, layout=layout)
 
-    # Add percent changes to legend
-    new_legend = []
-    for trace in fig.data:
-        stock = trace.name
-        new_legend.append(f"{stock} ({percent_changes[stock]:.2f}%)" if y_axis == 'Dollar Value' else f"{stock} (${df[stock].iloc[-1]:.2f})")
-    for i, trace in enumerate(fig.data):
-        trace.name = new_legend[i]
-
-    fig.update_layout(showlegend=True)
-    
     st.plotly_chart(fig, use_container_width=True)
 
 def main():
@@ -127,18 +228,22 @@ def main():
         )
 
     interval = '1m' if period == '1d' else '1d'
+    # Tuple so the argument is hashable for st.cache_data
+    tracked_symbols = tuple(st.session_state.tech_stocks.keys())
+    if not tracked_symbols:
+        st.info("No stocks are being tracked yet. Add one below to get started.")
     if period == 'Custom Date Range':
-        timeframe_data = get_timeframe_data(list(st.session_state.tech_stocks.keys()), start_date=start_date, end_date=end_date, interval=interval)
+        timeframe_data, dollar_changes, pct_changes = get_prices_and_changes(tracked_symbols, start_date=start_date, end_date=end_date, interval=interval)
     else:
-        timeframe_data = get_timeframe_data(list(st.session_state.tech_stocks.keys()), period=period, interval=interval)
+        timeframe_data, dollar_changes, pct_changes = get_prices_and_changes(tracked_symbols, period=period, interval=interval)
 
-    changes = calculate_changes(timeframe_data, y_axis)
+    changes = dollar_changes if y_axis == 'Dollar Value' else pct_changes
 
     if selection_mode == 'Top Gainers':
-        selected_stocks = sorted(changes, key=changes.get, reverse=True)[:10]
+        selected_stocks = changes.nlargest(10).index.tolist()
         plot_time_series(timeframe_data, selected_stocks, y_axis, "Top 10 Gainers")
     elif selection_mode == 'Top Losers':
-        selected_stocks = sorted(changes, key=changes.get)[:10]
+        selected_stocks = changes.nsmallest(10).index.tolist()
         plot_time_series(timeframe_data, selected_stocks, y_axis, "Top 10 Losers")
     else:  # Manual Selection
         selected_stocks = st.multiselect(
@@ -148,8 +253,10 @@ def main():
             max_selections=25
         )
         if selected_stocks:
-            gainer_stocks = [stock for stock in selected_stocks if changes[stock] > 0]
-            loser_stocks = [stock for stock in selected_stocks if changes[stock] <= 0]
+            # Partition gainers and losers in one vectorized comparison
+            selected_changes = changes[selected_stocks]
+            gainer_stocks = selected_changes.index[selected_changes > 0].tolist()
+            loser_stocks = selected_changes.index[selected_changes <= 0].tolist()
             if gainer_stocks:
                 plot_time_series(timeframe_data, gainer_stocks, y_axis, "Selected Gainers")
             if loser_stocks:
@@ -165,11 +272,19 @@ def main():
             new_stock_upper = new_stock.upper()
             if new_stock_upper not in st.session_state.tech_stocks:
                 try:
-                    stock = yf.Ticker(new_stock_upper)
-                    stock_info = stock.info
-                    st.session_state.tech_stocks[new_stock_upper] = stock_info['longName']
+                    import yfinance as yf
+
+                    stock = yf.Ticker(new_stock_upper, session=_SESSION)
+                    # fast_info only carries quote fields (no company name),
+                    # so use it as a cheap existence check and pay for the
+                    # full .info scrape -- now HTTP-cached -- only for real
+                    # tickers
+                    if stock.fast_info.get('lastPrice') is None:
+                        raise ValueError(f"No quote data for {new_stock_upper}")
+                    name = stock.info.get('longName') or stock.info['shortName']
+                    st.session_state.tech_stocks[new_stock_upper] = _as_stock_entry(name)
                     save_tracked_stocks(st.session_state.tech_stocks)
-                    st.write(f"Added {new_stock_upper} ({stock_info['longName']}) to the list of tracked stocks.")
+                    st.write(f"Added {new_stock_upper} ({name}) to the list of tracked stocks.")
                 except Exception as e:
                     st.write(f"Failed to add stock. Please check the symbol. Error: {e}")
             else:
@@ -179,35 +294,49 @@ def main():
     with st.expander("Tracked Stocks", expanded=False):
         st.write("Currently Tracking:")
 
-        # Create a DataFrame for tracked stocks
+        # Only refetch market caps that have aged out of the stored file;
+        # most of the day this is a pure JSON read with zero network cost
+        tracked = st.session_state.tech_stocks
+        now = time.time()
+        stale = tuple(
+            symbol for symbol, entry in tracked.items()
+            if now - entry.get('mc_fetched_at', 0) > MARKET_CAP_MAX_AGE
+        )
+        if stale:
+            updated = False
+            for symbol, market_cap in get_market_caps(stale).items():
+                # Failed fetches come back as None; keep the stored value
+                # and leave the symbol stale so the next rerun retries
+                if market_cap is None:
+                    continue
+                tracked[symbol]['market_cap'] = market_cap
+                tracked[symbol]['mc_fetched_at'] = now
+                updated = True
+            if updated:
+                save_tracked_stocks(tracked)
+
         tracked_stocks_data = []
-        for symbol, name in st.session_state.tech_stocks.items():
-            stock = yf.Ticker(symbol)
-            market_cap = stock.info.get('marketCap', 0) / 1e9  # Convert to billions
+        for symbol, entry in tracked.items():
+            market_cap = (entry['market_cap'] or 0) / 1e9  # Convert to billions
             tracked_stocks_data.append({
                 'Symbol': symbol,
-                'Name': name,
+                'Name': entry['name'],
                 'Market Cap ($B)': market_cap
             })
 
         tracked_stocks_df = pd.DataFrame(tracked_stocks_data)
 
-        # Display the table headers
-        col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
-        col1.write("**Symbol**")
-        col2.write("**Name**")
-        col3.write("**Market Cap ($B)**")
-        col4.write("")
-
-        # Display the table with remove buttons
-        for idx, row in tracked_stocks_df.iterrows():
-            col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
-            col1.write(row['Symbol'])
-            col2.write(row['Name'])
-            col3.write(f"{row['Market Cap ($B)']:.2f}")
-            if col4.button("Remove", key=f"remove_{row['Symbol']}"):
-                st.session_state.remove_symbol = row['Symbol']
-                st.session_state.show_confirmation = True
+        # One dataframe widget instead of four column widgets per row,
+        # which dominates render time once the watchlist grows
+        st.dataframe(tracked_stocks_df, use_container_width=True, hide_index=True)
+
+        remove_choice = st.selectbox(
+            "Remove a stock",
+            options=[""] + list(st.session_state.tech_stocks.keys())
+        )
+        if remove_choice and st.button("Remove"):
+            st.session_state.remove_symbol = remove_choice
+            st.session_state.show_confirmation = True
 
         if st.session_state.show_confirmation:
             symbol = st.session_state.remove_symbol